@@ -3,7 +3,12 @@ import fitz  # PyMuPDF
 from docx import Document
 import io
 import os
+import re
+import time
+import threading
+import uuid
 import base64
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -13,13 +18,127 @@ SUBJECT_CODE = "9696"
 SAVE_DIR = "pyp9696_qp"
 MS_DIR = "pyp9696_ms"
 DIAGRAM_DIR = "geography_diagrams"
-GALLERY_FILE = "geography_case_studies.csv"
-GLOSSARY_FILE = "geography_glossary.csv"
+# Each store is a folder of Parquet fragments: saves add a fragment instead of rewriting the file
+GALLERY_DIR = "geography_case_studies"
+GLOSSARY_DIR = "geography_glossary"
+LEGACY_FILES = {GALLERY_DIR: "geography_case_studies.csv", GLOSSARY_DIR: "geography_glossary.csv"}
+# Loading opens every fragment, so a store is compacted back to one file past this many
+MAX_PARTS = 50
 
-# Ensure all local storage folders exist
-for folder in [SAVE_DIR, MS_DIR, DIAGRAM_DIR]:
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+
+# Each rerun executes this script in a fresh module, so a module-level Lock() would not be shared
+@st.cache_resource(show_spinner=False)
+def _shared_lock(name):
+    """One lock per name for the whole server process."""
+    return threading.Lock()
+
+
+def _list_parts(dataset_dir):
+    return sorted(f for f in os.listdir(dataset_dir) if f.endswith(".parquet"))
+
+
+def _part_stamp(part):
+    """Timestamp a fragment name sorts by, e.g. 'part-1760000000000000000-<uuid>.parquet'."""
+    return int(part[len("part-"):].split(".")[0].split("-")[0])
+
+
+def _write_part(dataset_dir, df, stamp=None):
+    """Writes one fragment under a temp name and renames it, so readers never see it half-written.
+
+    The timestamp (default: now) keeps fragments in save order; the uuid keeps saves in the same
+    clock tick apart.
+    """
+    os.makedirs(dataset_dir, exist_ok=True)
+    name = f"part-{time.time_ns() if stamp is None else stamp}-{uuid.uuid4().hex}"
+    tmp = os.path.join(dataset_dir, f"{name}.tmp")
+    df.to_parquet(tmp, compression="snappy", index=False)
+    os.replace(tmp, os.path.join(dataset_dir, f"{name}.parquet"))
+
+
+def _append_part(dataset_dir, df):
+    """Writes rows as a new Parquet fragment; existing fragments are only re-read when compacting."""
+    _write_part(dataset_dir, df)
+    if len(_list_parts(dataset_dir)) > MAX_PARTS:
+        _compact_parts(dataset_dir)
+
+
+def _read_parts(dataset_dir):
+    """Reads all fragments of a store in save order.
+
+    Returns (frame, names of the fragments read); the frame is None if the store holds none.
+    """
+    while True:
+        parts = _list_parts(dataset_dir)
+        if not parts: return None, parts
+        try:
+            return pd.concat([pd.read_parquet(os.path.join(dataset_dir, p)) for p in parts], ignore_index=True), parts
+        except FileNotFoundError:
+            continue  # compacted by another session mid-read; its replacement is already in place
+
+
+def _rewrite_parts(dataset_dir, df, old_parts):
+    """Replaces the fragments df was read from with one compacted fragment.
+
+    Only old_parts are removed, so a fragment saved by another session meanwhile is kept; the
+    compacted fragment takes the last old timestamp so it still sorts before that newer save.
+    Callers hold _shared_lock("stores").
+    """
+    _write_part(dataset_dir, df, stamp=_part_stamp(old_parts[-1]) if old_parts else None)
+    for p in old_parts:
+        try:
+            os.remove(os.path.join(dataset_dir, p))
+        except FileNotFoundError:
+            pass
+
+
+def _compact_parts(dataset_dir):
+    """Merges a store's fragments into one file, if it has more than one."""
+    if not os.path.isdir(dataset_dir): return
+    with _shared_lock("stores"):
+        df, parts = _read_parts(dataset_dir)
+        if len(parts) > 1:
+            _rewrite_parts(dataset_dir, df, parts)
+
+
+def _year_of(source):
+    """Exam year from a source label such as '2025 P1 V11' (NaN if none)."""
+    match = re.search(r'\d{4}', str(source))
+    return float(match.group()) if match else float("nan")
+
+
+def migrate_to_parquet():
+    """One-shot conversion of the old CSV stores; the CSVs are left in place as a backup.
+
+    A store counts as migrated once it holds a fragment (deleting every row still leaves an
+    empty one), so a folder left behind by a failed run is migrated again.
+    """
+    for new_dir, old_csv in LEGACY_FILES.items():
+        if os.path.exists(old_csv) and (not os.path.isdir(new_dir) or not _list_parts(new_dir)):
+            df = pd.read_csv(old_csv)
+            if new_dir == GALLERY_DIR:
+                df['Year'] = df['Source'].map(_year_of)
+            _append_part(new_dir, df)
+
+
+@st.cache_resource(show_spinner=False)
+def _bootstrap_storage():
+    """Creates the local storage folders, once per server process."""
+    for folder in [SAVE_DIR, MS_DIR, DIAGRAM_DIR]:
+        os.makedirs(folder, exist_ok=True)
+
+
+@st.cache_resource(show_spinner=False)
+def _maintain_stores():
+    """Migrates old CSV stores and compacts fragments, once per server process.
+
+    A failure is not cached, so it is retried (and reported) on the next rerun.
+    """
+    migrate_to_parquet()
+    for store in [GALLERY_DIR, GLOSSARY_DIR]:
+        _compact_parts(store)
+
+
+_bootstrap_storage()
 
 # Syllabus structure for 9696
 geo_topics = {
@@ -36,68 +155,169 @@ variants_map = {
 }
 
 # --- 2. CORE ENGINE FUNCTIONS ---
-def extract_questions(path, keyword):
-    """Searches PDF for keywords and returns text by page."""
-    if not os.path.exists(path): return None
-    try:
+# Dehyphenated text lets keywords split across a line break still match
+TEXT_FLAGS = fitz.TEXTFLAGS_TEXT | fitz.TEXT_DEHYPHENATE
+# Caches keyed on (path, mtime) keep every old version of a replaced file unless bounded;
+# two Batch runs' worth of candidate papers (4 years x 3 sessions x 3 variants each)
+FILE_CACHE_ENTRIES = 72
+
+
+def _parse_pdf(path, read_page):
+    """Applies read_page to every page of a PDF.
+
+    PyMuPDF is not thread-safe, and Streamlit runs each browser session on its own thread.
+    """
+    with _shared_lock("fitz"):
         doc = fitz.open(path)
-        output = ""
-        for page in doc:
-            text = page.get_text()
-            if not keyword or keyword.lower() in text.lower():
-                output += f"\n--- {os.path.basename(path)} (P.{page.number + 1}) ---\n{text}"
+        pages = tuple(read_page(page) for page in doc)
         doc.close()
+    return pages
+
+
+def _page_text(page):
+    text = page.get_text(flags=TEXT_FLAGS)
+    return text, text.lower()
+
+
+def _page_blocks(page):
+    # Block tuples are (x0, y0, x1, y1, text, block_no, block_type); type 0 is text, 1 is an image
+    return tuple((b[4], b[4].lower()) for b in page.get_text("blocks", flags=TEXT_FLAGS) if b[6] == 0)
+
+
+# The results are immutable tuples, so cache_resource can share them across reruns and
+# keywords without the per-call copy cache_data makes; fitz.Document itself is never cached.
+@st.cache_resource(max_entries=FILE_CACHE_ENTRIES, show_spinner=False)
+def _pdf_pages(path, mtime):
+    """Reads (text, lower-cased text) for every PDF page once; mtime refreshes it when the file is replaced."""
+    return _parse_pdf(path, _page_text)
+
+
+@st.cache_resource(max_entries=FILE_CACHE_ENTRIES, show_spinner=False)
+def _pdf_blocks(path, mtime):
+    """Same as _pdf_pages, but split into the text blocks of each page."""
+    return _parse_pdf(path, _page_blocks)
+
+
+def extract_questions(path, kw_lower, blocks_only=False):
+    """Searches PDF for an already lower-cased keyword and returns text by page.
+
+    With blocks_only, only the text blocks containing the keyword are kept, which
+    drops headers and rubric boilerplate from compiled booklets.
+    """
+    if not os.path.exists(path): return None
+    try:
+        mtime = os.path.getmtime(path)
+        base = os.path.basename(path)
+        if blocks_only and kw_lower:
+            parts = []
+            for i, blocks in enumerate(_pdf_blocks(path, mtime)):
+                hits = [text for text, text_lower in blocks if kw_lower in text_lower]
+                if hits: parts.append(f"\n--- {base} (P.{i + 1}) ---\n" + "\n".join(hits))
+            output = "".join(parts)
+        else:
+            pages = _pdf_pages(path, mtime)
+            output = "".join(f"\n--- {base} (P.{i + 1}) ---\n{text}" for i, (text, text_lower) in enumerate(pages)
+                             if not kw_lower or kw_lower in text_lower)
         return output if output.strip() else None
     except Exception as e:
         return f"Error reading PDF: {e}"
 
 
+@st.cache_data(max_entries=FILE_CACHE_ENTRIES, show_spinner=False)
+def _pdf_base64(path, mtime):
+    """Base64 form of a PDF, encoded once per file version."""
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode('utf-8')
+
+
 def display_pdf(file_path):
     """Renders PDF in Streamlit iframe."""
-    with open(file_path, "rb") as f:
-        base64_pdf = base64.b64encode(f.read()).decode('utf-8')
+    base64_pdf = _pdf_base64(file_path, os.path.getmtime(file_path))
     pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="800" type="application/pdf"></iframe>'
     st.markdown(pdf_display, unsafe_allow_html=True)
 
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _folder_index(folder):
+    """Set of file names in a paper folder, so existence checks skip the filesystem."""
+    return set(os.listdir(folder))
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _diagram_files():
+    """Image files in the Diagram Library."""
+    return [f for f in os.listdir(DIAGRAM_DIR) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
+
+
+@st.cache_data(max_entries=FILE_CACHE_ENTRIES, show_spinner=False)
+def _img_bytes(path, mtime):
+    """Raw bytes of a diagram, read once per file version."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
 ##############################################################
+def _mtime(path):
+    """Cache key for file-backed loaders: changes whenever the file or store folder is modified (0 if missing)."""
+    try:
+        return os.stat(path).st_mtime
+    except FileNotFoundError:
+        return 0
+
+
+@st.cache_data(show_spinner=False)
+def load_gallery(mtime):
+    """Loads the Case Study Bank once per store version."""
+    df, _ = _read_parts(GALLERY_DIR)
+    if df is None: df = pd.DataFrame(columns=["Date Saved", "Topic", "Source", "Content", "Year"])
+    # Topics and sources repeat across many snippets, so categories keep them small and fast to group
+    return df.astype({"Topic": "category", "Source": "category"})
+
+
+@st.cache_data(show_spinner=False)
+def load_glossary(mtime):
+    """Loads the glossary once per store version; the first definition saved for a term wins."""
+    df, _ = _read_parts(GLOSSARY_DIR)
+    if df is None: return pd.DataFrame(columns=["Term", "Definition"])
+    return df.drop_duplicates(subset=['Term'], ignore_index=True)
+
+
 def save_to_gallery(topic, content, metadata):
     try:
         new_entry = pd.DataFrame([{
             "Date Saved": datetime.now().strftime("%Y-%m-%d"),
             "Topic": topic,
             "Source": metadata,
-            "Content": content
+            "Content": content,
+            "Year": _year_of(metadata)
         }])
         # This ensures the file is saved exactly where the script is
-        file_path = os.path.join(os.getcwd(), GALLERY_FILE)
+        file_path = os.path.join(os.getcwd(), GALLERY_DIR)
 
-        if os.path.exists(file_path):
-            df = pd.read_csv(file_path)
-            df = pd.concat([df, new_entry], ignore_index=True)
-        else:
-            df = new_entry
-
-        df.to_csv(file_path, index=False)
+        _append_part(file_path, new_entry)
+        load_gallery.clear()
         st.success(f"✅ Saved to: {file_path}")  # This tells us exactly where it went!
     except Exception as e:
         st.error(f"❌ Save failed: {e}")
 
 def save_to_glossary(term, definition):
-    """Saves definitions to CSV."""
-    new_entry = pd.DataFrame([{"Term": term, "Definition": definition}])
-    df = pd.concat([pd.read_csv(GLOSSARY_FILE), new_entry] if os.path.exists(GLOSSARY_FILE) else [new_entry],
-                   ignore_index=True).drop_duplicates(subset=['Term'])
-    df.to_csv(GLOSSARY_FILE, index=False)
+    """Saves definitions to Parquet; duplicate terms are dropped by load_glossary."""
+    _append_part(GLOSSARY_DIR, pd.DataFrame([{"Term": term, "Definition": definition}]))
+    load_glossary.clear()
 
 def analyze_predictions(current_year):
     """Calculates topic priority based on last seen date in Gallery."""
-    if not os.path.exists(GALLERY_FILE): return None
-    df = pd.read_csv(GALLERY_FILE)
-    df['Year'] = df['Source'].str.extract(r'(\d{4})').astype(float)
+    if not os.path.exists(GALLERY_DIR): return None
+    df = load_gallery(_mtime(GALLERY_DIR))
+    # One groupby over the saved topics; the syllabus loop below only touches this dict
+    topic_lower = df['Topic'].str.lower()
+    last_seen_by_topic = df.groupby(topic_lower)['Year'].max().dropna().to_dict()
     analysis = []
     for cat, units in geo_topics.items():
         for unit in units:
-            last_seen = df[df['Topic'].str.contains(unit, case=False)]['Year'].max()
+            unit_lower = unit.lower()
+            last_seen = max((yr for topic, yr in last_seen_by_topic.items() if unit_lower in topic),
+                            default=float("nan"))
             if pd.isna(last_seen):
                 status = "No Data"; color = "gray"
             elif (current_year - last_seen) >= 2:
@@ -109,10 +329,21 @@ def analyze_predictions(current_year):
             analysis.append({"Component": cat, "Unit": unit, "Last Examined": last_seen, "Priority": status})
     return pd.DataFrame(analysis)
 
+
+@st.cache_data(show_spinner=False)
+def analyze_predictions_cached(current_year, mtime):
+    """analyze_predictions, recomputed only when the gallery changes."""
+    return analyze_predictions(current_year)
+
 # --- 3. STREAMLIT INTERFACE ---
 st.set_page_config(page_title="Geography 9696 Tutor Portal", layout="wide")
 st.title("🌍 Geography 9696 PYP Portal")
 
+try:
+    _maintain_stores()
+except Exception as e:
+    st.error(f"❌ Case study storage upkeep failed: {e}")
+
 # SIDEBAR: MANAGEMENT
 # --- 1. Put the Password box in the Sidebar ---
 with st.sidebar:
@@ -136,6 +367,7 @@ with st.sidebar:
             path = os.path.join(SAVE_DIR if prefix == "qp" else MS_DIR, new_fn)
             with open(path, "wb") as f:
                 f.write(u_file.getbuffer())
+            _folder_index.clear()
             st.success(f"Successfully Stored: {new_fn}")
         else:
             st.error("Please upload a file first.")
@@ -162,10 +394,13 @@ with t1:
     # TRIGGER SEARCH
     if st.button("Search Papers"):
         found_data = []
+        qp_files = _folder_index(SAVE_DIR)
+        kw = (s_topic or "").lower()
         for s in ["m", "s", "w"]:
             fn = f"{SUBJECT_CODE}_{s}{str(s_yr)[-2:]}_qp_{s_v}.pdf"
+            if fn not in qp_files: continue
             path = os.path.join(SAVE_DIR, fn)
-            res = extract_questions(path, s_topic)
+            res = extract_questions(path, kw)
             if res:
                 found_data.append({"text": res, "src": f"{s_yr} P{s_p} V{s_v}", "session": s})
 
@@ -174,6 +409,7 @@ with t1:
 
     # DISPLAY results from memory
     if 'geo_search_results' in st.session_state:
+        ms_files = _folder_index(MS_DIR)
         for i, item in enumerate(st.session_state['geo_search_results']):
             st.info(item['text'][:600] + "...")
 
@@ -190,9 +426,16 @@ with t1:
                 ms_fn = f"{SUBJECT_CODE}_{item['session']}{year_short}_ms_{s_v}.pdf"
                 ms_path = os.path.join(MS_DIR, ms_fn)
 
-                if os.path.exists(ms_path):
-                    with open(ms_path, "rb") as f:
-                        st.download_button("📂 View Answer Scheme", f, file_name=ms_fn, key=f"ms_btn_{i}")
+                ms_bytes = None
+                if ms_fn in ms_files:
+                    try:
+                        with open(ms_path, "rb") as f:
+                            ms_bytes = f.read()
+                    except FileNotFoundError:
+                        pass  # removed since the folder index was cached
+
+                if ms_bytes is not None:
+                    st.download_button("📂 View Answer Scheme", ms_bytes, file_name=ms_fn, key=f"ms_btn_{i}")
                 else:
                     st.caption("MS not found in pyp9696_ms")
 
@@ -202,20 +445,29 @@ with t2:
     b_start = st.number_input("Batch Start Year", 2018, 2025, 2022)
     b_topic = st.text_input("Booklet Topic (e.g. 'Hazards')")
     if st.button("🚀 Compile 3-Year Booklet"):
-        all_text = ""
+        jobs = []
+        qp_files = _folder_index(SAVE_DIR)
         for yr in range(b_start, b_start + 4):
             for s in ["m", "s", "w"]:
                 # Logic iterates through all variants for that paper type
                 for v in variants_map["1"]:  # Checks common variants
                     fn = f"{SUBJECT_CODE}_{s}{str(yr)[-2:]}_qp_{v}.pdf"
                     path = os.path.join(SAVE_DIR, fn)
-                    res = extract_questions(path, b_topic)
-                    if res: all_text += f"\n\n{'=' * 40}\nYEAR: {yr} | SESSION: {s.upper()}\n{'=' * 40}\n{res}"
+                    if fn in qp_files: jobs.append((yr, s, path))
 
-        if all_text:
+        b_kw = (b_topic or "").lower()
+        sections = []
+        for yr, s, path in jobs:
+            res = extract_questions(path, b_kw, blocks_only=True)
+            if res: sections.append((f"YEAR: {yr} | SESSION: {s.upper()} | {os.path.basename(path)}", res.strip()))
+
+        if sections:
             doc = Document();
             doc.add_heading(f'9696 Geography: {b_topic}', 0);
-            doc.add_paragraph(all_text)
+            # One heading and paragraph per paper keeps each XML run small
+            for header, body in sections:
+                doc.add_heading(header, level=2)
+                doc.add_paragraph(body)
             bio = io.BytesIO();
             doc.save(bio)
             st.download_button("📥 Download Word Booklet", bio.getvalue(), f"9696_{b_topic}_Booklet.docx")
@@ -226,8 +478,8 @@ with t2:
 with t3:
     st.subheader("🖼️ Case Study Bank")
 
-    if os.path.exists(GALLERY_FILE):
-        df = pd.read_csv(GALLERY_FILE)
+    if os.path.exists(GALLERY_DIR):
+        df = load_gallery(_mtime(GALLERY_DIR))
 
         if not df.empty:
             st.write(f"✅ Found {len(df)} entries")
@@ -244,8 +496,12 @@ with t3:
                 with col2:
                     # Unique key for each delete button based on index
                     if st.button("🗑️ Delete", key=f"del_{i}"):
-                        df = df.drop(i)
-                        df.to_csv(GALLERY_FILE, index=False)
+                        # Rewrite from a fresh read, so only the fragments actually read are replaced
+                        with _shared_lock("stores"):
+                            current, parts = _read_parts(GALLERY_DIR)
+                            if current is not None:
+                                _rewrite_parts(GALLERY_DIR, current[current.index != i], parts)
+                        load_gallery.clear()
                         st.rerun()
         else:
             st.warning("Gallery is currently empty.")
@@ -254,8 +510,8 @@ with t3:
 
 with t4:
     st.subheader("📝 Handout Creator")
-    if os.path.exists(GALLERY_FILE):
-        gal_df = pd.read_csv(GALLERY_FILE)
+    if os.path.exists(GALLERY_DIR):
+        gal_df = load_gallery(_mtime(GALLERY_DIR))
 
         if not gal_df.empty:
             # 1. Choose the Case Study text
@@ -263,7 +519,7 @@ with t4:
                                   format_func=lambda x: f"{gal_df.iloc[x]['Topic']} ({gal_df.iloc[x]['Source']})")
 
             # 2. THIS IS THE NEW LINE YOU NEED TO SEE ON SCREEN
-            diag_files = [f for f in os.listdir(DIAGRAM_DIR) if f.endswith(('.png', '.jpg', '.jpeg'))]
+            diag_files = _diagram_files()
             selected_diag = st.selectbox("2. Choose a Diagram from Library", ["None"] + diag_files)
 
             # 3. The Button
@@ -275,11 +531,16 @@ with t4:
 
                 # Image Insertion Logic
                 if selected_diag != "None":
-                    doc.add_heading("Refer to the Diagram Below", level=1)
                     diag_path = os.path.join(DIAGRAM_DIR, selected_diag)
-                    from docx.shared import Inches
+                    # The cached listing can still offer a diagram removed outside the app
+                    diag_mtime = _mtime(diag_path)
+                    if diag_mtime:
+                        doc.add_heading("Refer to the Diagram Below", level=1)
+                        from docx.shared import Inches
 
-                    doc.add_picture(diag_path, width=Inches(4))
+                        doc.add_picture(io.BytesIO(_img_bytes(diag_path, diag_mtime)), width=Inches(4))
+                    else:
+                        st.warning(f"{selected_diag} is no longer in the Diagram Library, so it was left out.")
 
                 # Tasks
                 doc.add_heading("Tasks", level=1)
@@ -304,20 +565,25 @@ with t5:
             path = os.path.join(DIAGRAM_DIR, f"{clean_name}.png")
             with open(path, "wb") as f:
                 f.write(diag_up.getbuffer())
+            _diagram_files.clear()
             st.success("Diagram Added!")
             st.rerun()
 
     st.divider()
 
-    # Display images with a delete button
-    files = os.listdir(DIAGRAM_DIR)
-    if files:
+    # Display images with a delete button; one stat per file skips files removed outside the app
+    # (the cached listing can lag) and keys the image cache
+    diagrams = []
+    for f_name in _diagram_files():
+        f_mtime = _mtime(os.path.join(DIAGRAM_DIR, f_name))
+        if f_mtime: diagrams.append((f_name, f_mtime))
+    if diagrams:
         cols = st.columns(3)
         # Your existing Line 325 loop
-        for i, f_name in enumerate(files):
+        for i, (f_name, f_mtime) in enumerate(diagrams):
             with cols[i % 3]:
                 img_path = os.path.join(DIAGRAM_DIR, f_name)
-                st.image(img_path)
+                st.image(_img_bytes(img_path, f_mtime))
 
                 c_lab, c_del = st.columns([0.8, 0.2])
                 with c_lab:
@@ -328,6 +594,7 @@ with t5:
                     if is_authorized:
                         if st.button("🗑️", key=f"del_diag_{i}"):
                             os.remove(img_path)
+                            _diagram_files.clear()
                             st.toast(f"Deleted {f_name}")
                             st.rerun()
                     else:
@@ -338,14 +605,15 @@ with t5:
 
 with t6:
     st.subheader("📈 Exam Question Predictor")
-    pred_df = analyze_predictions(2026)
+    pred_df = analyze_predictions_cached(2026, _mtime(GALLERY_DIR))
     if pred_df is not None:
-        def style_priority(v):
-            if "High" in v: return 'color: red; font-weight: bold'
-            if "Medium" in v: return 'color: orange'
-            return 'color: green'
+        # One vectorized pass picks each row's style instead of a Python call per cell
+        priority_css = np.select(
+            [pred_df['Priority'].str.contains("High", regex=False, na=False),
+             pred_df['Priority'].str.contains("Medium", regex=False, na=False)],
+            ['color: red; font-weight: bold', 'color: orange'], default='color: green')
 
-        st.dataframe(pred_df.style.applymap(style_priority, subset=['Priority']))
+        st.dataframe(pred_df.style.apply(lambda _: priority_css, subset=['Priority']))
         st.info("Priority is based on how long it has been since a topic was last saved to your Case Study Bank.")
     else:
         st.warning("Save snippets to the Case Study Bank to enable prediction analysis.")